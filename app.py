@@ -1,5 +1,42 @@
+import numpy as np
+import pandas as pd
 import streamlit as st
 
+# Static markdown blocks, built once at import instead of on every rerun
+_ARITH_MD = """
+**Arithmetic Sequence Formula:** aₙ = a₁ + (n-1)d
+- a₁ = first term
+- d = common difference  
+- n = term position
+"""
+
+_GEOM_MD = """
+**Geometric Sequence Formula:** aₙ = a₁ × r^(n-1)
+- a₁ = first term
+- r = common ratio
+- n = term position
+"""
+
+FORMULA_MD = {
+    "Arithmetic Sequence": _ARITH_MD,
+    "Geometric Sequence": _GEOM_MD,
+}
+
+_EXAMPLES_MD = """
+**Examples:**
+- **Natural Numbers:** First term = 1, Common difference = 1
+- **Even Numbers:** First term = 2, Common difference = 2
+- **Decreasing Sequence:** First term = 10, Common difference = -1
+- **Decimal Sequence:** First term = 0.5, Common difference = 0.5
+
+**Tips:**
+- Use positive common difference for increasing sequences
+- Use negative common difference for decreasing sequences
+- Decimal values are supported for both terms and differences
+- Maximum of 1000 terms can be generated at once
+"""
+
+@st.cache_data(max_entries=32)
 def generate_arithmetic_sequence(first_term, common_difference, num_terms):
     """
     Generate an arithmetic sequence given the first term, common difference, and number of terms.
@@ -10,14 +47,12 @@ def generate_arithmetic_sequence(first_term, common_difference, num_terms):
         num_terms (int): The number of terms to generate
     
     Returns:
-        list: The arithmetic sequence as a list of numbers
+        numpy.ndarray: The arithmetic sequence as a float64 array
     """
-    sequence = []
-    for n in range(num_terms):
-        term = first_term + (n * common_difference)
-        sequence.append(term)
-    return sequence
+    n = np.arange(num_terms, dtype=np.float64)
+    return first_term + n * common_difference
 
+@st.cache_data(max_entries=32)
 def generate_geometric_sequence(first_term, common_ratio, num_terms):
     """
     Generate a geometric sequence given the first term, common ratio, and number of terms.
@@ -28,13 +63,66 @@ def generate_geometric_sequence(first_term, common_ratio, num_terms):
         num_terms (int): The number of terms to generate
     
     Returns:
-        list: The geometric sequence as a list of numbers
+        numpy.ndarray: The geometric sequence as a float64 array
+    """
+    exps = np.arange(num_terms, dtype=np.float64)
+    # Overflow shows up as inf/nan terms, which main reports to the user
+    with np.errstate(over="ignore", invalid="ignore"):
+        return first_term * np.power(common_ratio, exps)
+
+@st.cache_data(max_entries=32)
+def build_arithmetic_table(first_term, common_difference, num_rows):
+    """
+    Build the rows of the detailed view table for an arithmetic sequence.
+    
+    Args:
+        first_term (float): The first term of the sequence
+        common_difference (float): The common difference between consecutive terms
+        num_rows (int): The number of rows to build
+    
+    Returns:
+        pandas.DataFrame: One row per term with its position, value and calculation
     """
-    sequence = []
-    for n in range(num_terms):
-        term = first_term * (common_ratio ** n)
-        sequence.append(term)
-    return sequence
+    n = np.arange(1, num_rows + 1)
+    terms = generate_arithmetic_sequence(first_term, common_difference, num_rows)
+    prefix = f"{first_term} + ("
+    mid = f") × {common_difference} = "
+    calc = np.char.add(np.char.add(np.char.add(prefix, (n - 1).astype(str)), mid), terms.astype(str))
+    return pd.DataFrame({"Position (n)": n, "Term (aₙ)": terms, "Calculation": calc})
+
+@st.cache_data(max_entries=32)
+def build_geometric_table(first_term, common_ratio, num_rows):
+    """
+    Build the rows of the detailed view table for a geometric sequence.
+    
+    Args:
+        first_term (float): The first term of the sequence
+        common_ratio (float): The common ratio between consecutive terms
+        num_rows (int): The number of rows to build
+    
+    Returns:
+        pandas.DataFrame: One row per term with its position, value and calculation
+    """
+    n = np.arange(1, num_rows + 1)
+    terms = generate_geometric_sequence(first_term, common_ratio, num_rows)
+    r = f"({common_ratio})" if common_ratio < 0 else f"{common_ratio}"
+    prefix = f"{first_term} × {r}^"
+    calc = np.char.add(np.char.add(np.char.add(prefix, (n - 1).astype(str)), " = "), terms.astype(str))
+    return pd.DataFrame({"Position (n)": n, "Term (aₙ)": terms, "Calculation": calc})
+
+def calculate_arithmetic_sum(first_term, common_difference, num_terms):
+    """
+    Calculate the sum of an arithmetic series.
+    
+    Args:
+        first_term (float): The first term of the sequence
+        common_difference (float): The common difference between consecutive terms
+        num_terms (int): The number of terms to sum
+    
+    Returns:
+        float: The sum of the arithmetic series
+    """
+    return num_terms * (2 * first_term + (num_terms - 1) * common_difference) / 2
 
 def calculate_geometric_sum(first_term, common_ratio, num_terms):
     """
@@ -74,164 +162,154 @@ def main():
         help="Select the type of sequence you want to generate"
     )
     
-    if sequence_type == "Arithmetic Sequence":
-        st.markdown("""
-        **Arithmetic Sequence Formula:** aₙ = a₁ + (n-1)d
-        - a₁ = first term
-        - d = common difference  
-        - n = term position
-        """)
-    else:
-        st.markdown("""
-        **Geometric Sequence Formula:** aₙ = a₁ × r^(n-1)
-        - a₁ = first term
-        - r = common ratio
-        - n = term position
-        """)
+    st.markdown(FORMULA_MD[sequence_type])
     
     # Create input section
     st.header("Parameters")
     
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        first_term = st.number_input(
-            "First Term (a₁)",
-            value=1.0,
-            step=1.0,
-            help="The first number in the sequence"
-        )
-    
-    with col2:
-        if sequence_type == "Arithmetic Sequence":
-            second_param = st.number_input(
-                "Common Difference (d)",
+    # Batch input edits in a form so the sequence is only rebuilt on submit
+    with st.form("seq_form"):
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            first_term = st.number_input(
+                "First Term (a₁)",
                 value=1.0,
                 step=1.0,
-                help="The constant difference between consecutive terms"
+                help="The first number in the sequence"
             )
-        else:
-            second_param = st.number_input(
-                "Common Ratio (r)",
-                value=2.0,
-                step=0.1,
-                help="The constant ratio between consecutive terms"
+        
+        with col2:
+            if sequence_type == "Arithmetic Sequence":
+                common_difference = st.number_input(
+                    "Common Difference (d)",
+                    value=1.0,
+                    step=1.0,
+                    help="The constant difference between consecutive terms"
+                )
+            else:
+                common_ratio = st.number_input(
+                    "Common Ratio (r)",
+                    value=2.0,
+                    step=0.1,
+                    help="The constant ratio between consecutive terms"
+                )
+        
+        with col3:
+            num_terms = st.number_input(
+                "Number of Terms",
+                min_value=1,
+                max_value=1000,
+                value=10,
+                step=1,
+                help="How many terms to generate (max: 1000)"
             )
-    
-    with col3:
-        num_terms = st.number_input(
-            "Number of Terms",
-            min_value=1,
-            max_value=1000,
-            value=10,
-            step=1,
-            help="How many terms to generate (max: 1000)"
-        )
+        
+        submitted = st.form_submit_button("Generate Sequence", type="primary")
     
     # Input validation and sequence generation
-    if st.button("Generate Sequence", type="primary"):
-        try:
-            # Convert num_terms to integer for validation
-            num_terms = int(num_terms)
-            
-            if num_terms <= 0:
-                st.error("Number of terms must be a positive integer.")
-                return
-            
-            if num_terms > 1000:
-                st.error("Number of terms cannot exceed 1000.")
-                return
-            
-            # Generate the sequence
+    if submitted:
+        # Convert num_terms to integer for validation
+        num_terms = int(num_terms)
+        
+        if num_terms <= 0:
+            st.error("Number of terms must be a positive integer.")
+            return
+        
+        if num_terms > 1000:
+            st.error("Number of terms cannot exceed 1000.")
+            return
+        
+        # Generate the sequence and its summary values
+        if sequence_type == "Arithmetic Sequence":
             sequence = generate_arithmetic_sequence(first_term, common_difference, num_terms)
-            
-            # Display results
-            st.header("Results")
-            
-            # Show sequence info
-            st.subheader("Sequence Information")
-            col1, col2, col3, col4 = st.columns(4)
-            
-            with col1:
-                st.metric("First Term", f"{first_term}")
-            with col2:
+            sequence_sum = calculate_arithmetic_sum(first_term, common_difference, num_terms)
+            average = first_term + (num_terms - 1) * common_difference / 2
+        else:
+            sequence = generate_geometric_sequence(first_term, common_ratio, num_terms)
+            try:
+                sequence_sum = calculate_geometric_sum(first_term, common_ratio, num_terms)
+            except OverflowError:
+                sequence_sum = float("inf")
+            average = sequence_sum / num_terms
+        
+        if not (np.isfinite(sequence).all() and np.isfinite(sequence_sum)):
+            st.error("Terms exceed floating-point range; reduce the ratio or number of terms")
+            return
+        
+        # Display results
+        st.header("Results")
+        
+        # Show sequence info
+        st.subheader("Sequence Information")
+        col1, col2, col3, col4 = st.columns(4)
+        
+        with col1:
+            st.metric("First Term", f"{first_term}")
+        with col2:
+            if sequence_type == "Arithmetic Sequence":
                 st.metric("Common Difference", f"{common_difference}")
-            with col3:
-                st.metric("Number of Terms", f"{num_terms}")
-            with col4:
-                st.metric("Last Term", f"{sequence[-1]}")
-            
-            # Display the sequence
-            st.subheader("Arithmetic Sequence")
-            
-            # Format sequence for display
-            if num_terms <= 20:
-                # Show all terms for small sequences
-                sequence_str = ", ".join([str(term) for term in sequence])
-                st.write(f"**Sequence:** {sequence_str}")
             else:
-                # Show first 10 and last 10 terms for large sequences
-                first_10 = sequence[:10]
-                last_10 = sequence[-10:]
-                first_str = ", ".join([str(term) for term in first_10])
-                last_str = ", ".join([str(term) for term in last_10])
-                st.write(f"**First 10 terms:** {first_str}")
-                st.write(f"**Last 10 terms:** {last_str}")
-                st.info(f"Showing first and last 10 terms of {num_terms} total terms")
-            
-            # Show as table for better readability
+                st.metric("Common Ratio", f"{common_ratio}")
+        with col3:
+            st.metric("Number of Terms", f"{num_terms}")
+        with col4:
+            st.metric("Last Term", f"{sequence[-1]}")
+        
+        # Display the sequence
+        st.subheader(sequence_type)
+        
+        # Format sequence for display
+        if num_terms <= 20:
+            # Show all terms for small sequences
+            sequence_str = ", ".join(map(str, sequence.tolist()))
+            st.write(f"**Sequence:** {sequence_str}")
+        else:
+            # Show first 10 and last 10 terms for large sequences
+            first_10 = sequence[:10]
+            last_10 = sequence[-10:]
+            first_str = ", ".join(map(str, first_10.tolist()))
+            last_str = ", ".join(map(str, last_10.tolist()))
+            st.write(f"**First 10 terms:** {first_str}")
+            st.write(f"**Last 10 terms:** {last_str}")
+            st.info(f"Showing first and last 10 terms of {num_terms} total terms")
+        
+        # Show as table for better readability; skipped when every term is already listed inline
+        if num_terms > 10:
             st.subheader("Detailed View")
             
-            # Create a table with term position and value
-            table_data = []
-            for i, term in enumerate(sequence[:50], 1):  # Limit table to first 50 terms
-                table_data.append({
-                    "Position (n)": i,
-                    "Term (aₙ)": term,
-                    "Calculation": f"{first_term} + ({i-1}) × {common_difference} = {term}"
-                })
+            # Create a table with term position and value (limited to first 50 terms)
+            if sequence_type == "Arithmetic Sequence":
+                table_df = build_arithmetic_table(first_term, common_difference, min(num_terms, 50))
+            else:
+                table_df = build_geometric_table(first_term, common_ratio, min(num_terms, 50))
             
-            st.dataframe(table_data, use_container_width=True)
+            st.dataframe(table_df, use_container_width=True, hide_index=True)
             
             if num_terms > 50:
                 st.info(f"Table shows first 50 terms of {num_terms} total terms")
-            
-            # Additional calculations
-            st.subheader("Additional Information")
-            sequence_sum = sum(sequence)
-            average = sequence_sum / num_terms
-            
-            col1, col2 = st.columns(2)
-            with col1:
-                st.metric("Sum of Sequence", f"{sequence_sum}")
-            with col2:
-                st.metric("Average Value", f"{average:.2f}")
-            
-            # Show the general formula for this specific sequence
-            st.subheader("Formula for this Sequence")
-            if common_difference >= 0:
-                st.latex(f"a_n = {first_term} + (n-1) \\times {common_difference}")
-            else:
-                st.latex(f"a_n = {first_term} + (n-1) \\times ({common_difference})")
-            
-        except Exception as e:
-            st.error(f"An error occurred while generating the sequence: {str(e)}")
+        
+        # Additional calculations
+        st.subheader("Additional Information")
+        col1, col2 = st.columns(2)
+        with col1:
+            st.metric("Sum of Sequence", f"{sequence_sum}")
+        with col2:
+            st.metric("Average Value", f"{average:.2f}")
+        
+        # Show the general formula for this specific sequence
+        st.subheader("Formula for this Sequence")
+        if sequence_type == "Arithmetic Sequence":
+            d = f"{common_difference}" if common_difference >= 0 else f"({common_difference})"
+            formula_latex = f"a_n = {first_term} + (n-1) \\times {d}"
+        else:
+            r = f"{common_ratio}" if common_ratio >= 0 else f"({common_ratio})"
+            formula_latex = f"a_n = {first_term} \\times {r}^{{n-1}}"
+        st.latex(formula_latex)
     
     # Add some example usage
     with st.expander("ℹ️ Examples and Tips"):
-        st.markdown("""
-        **Examples:**
-        - **Natural Numbers:** First term = 1, Common difference = 1
-        - **Even Numbers:** First term = 2, Common difference = 2
-        - **Decreasing Sequence:** First term = 10, Common difference = -1
-        - **Decimal Sequence:** First term = 0.5, Common difference = 0.5
-        
-        **Tips:**
-        - Use positive common difference for increasing sequences
-        - Use negative common difference for decreasing sequences
-        - Decimal values are supported for both terms and differences
-        - Maximum of 1000 terms can be generated at once
-        """)
+        st.markdown(_EXAMPLES_MD)
 
 if __name__ == "__main__":
     main()